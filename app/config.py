@@ -1,8 +1,19 @@
-from pydantic_settings import BaseSettings
-from typing import List
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True,
+    )
+
     # Application
     APP_NAME: str = "Forsa AI"
     APP_VERSION: str = "0.1.0"
@@ -44,13 +55,33 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
 
-    @property
-    def origins_list(self) -> List[str]:
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
+    @cached_property
+    def origins_list(self) -> Tuple[str, ...]:
+        return tuple(origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip())
+
+    @model_validator(mode="after")
+    def _precompute_origins(self) -> "Settings":
+        # Populate the cached tuple at load time so reads are plain attribute hits
+        self.origins_list
+        return self
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Settings":
+        """Copy the settings, recomputing values derived from the fields.
+
+        ``model_copy`` skips validation and copies the instance ``__dict__``,
+        so without this the copy would keep the source's cached origins.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("origins_list", None)
+        copied.origins_list
+        return copied
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance.
 
-settings = Settings()
+    The .env file is parsed and validated only once; every later call
+    returns the cached object. Use with FastAPI ``Depends(get_settings)``.
+    """
+    return Settings()
@@ -0,0 +1,46 @@
+"""
+Logging setup for the API process.
+
+Functions:
+    configure_logging: Install the root handler once and set the log level
+"""
+
+import logging
+import logging.config
+from typing import Any, Dict
+
+# Built once at import; dictConfig applies it without per-argument parsing
+LOGGING_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        },
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "default",
+        },
+    },
+    "root": {
+        "handlers": ["console"],
+    },
+}
+
+
+def configure_logging(level: str) -> None:
+    """Configure root logging for this process.
+
+    The console handler is only installed when the root logger has none,
+    so a process whose host (or an earlier call) already set up logging
+    does not emit every record twice.
+
+    Args:
+        level: Level name such as ``INFO`` (case-insensitive)
+    """
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.config.dictConfig(LOGGING_CONFIG)
+    root.setLevel(level.upper())
@@ -0,0 +1,56 @@
+"""
+JSON codec for PostgreSQL JSON/JSONB columns.
+
+SQLAlchemy serializes JSONB values with the stdlib ``json`` module by
+default. Every i18n column round-trips a small dict of (mostly non-ASCII)
+text through it on each read and write, so engines use orjson instead:
+
+    >>> engine = create_async_engine(
+    ...     url,
+    ...     json_serializer=json_serializer,
+    ...     json_deserializer=json_deserializer,
+    ... )
+
+Functions:
+    json_serializer: Encode a Python value to a JSON string
+    json_deserializer: Decode a JSON string to a Python value
+"""
+
+from typing import Any
+
+import orjson
+
+
+def json_serializer(value: Any) -> str:
+    """Encode a value for a JSON/JSONB bind parameter.
+
+    The asyncpg dialect expects ``str`` from the serializer, so orjson's
+    UTF-8 bytes are decoded once here. Non-ASCII text is written as-is
+    rather than as ``\\uXXXX`` escapes.
+
+    This applies to every JSON/JSONB column on the engine, so the accepted
+    input is wider than stdlib ``json``: non-string dict keys are coerced
+    to strings (as ``json.dumps`` does), and ``datetime``, ``date``,
+    ``UUID`` and dataclass values are encoded instead of raising
+    ``TypeError``. They are stored as plain JSON strings/objects and read
+    back as such, not as the original Python types.
+
+    Args:
+        value: JSON-compatible Python value
+
+    Returns:
+        Compact JSON document
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def json_deserializer(value: str) -> Any:
+    """Decode a JSON/JSONB result value.
+
+    Args:
+        value: JSON document as returned by the driver
+
+    Returns:
+        Decoded Python value
+    """
+    return orjson.loads(value)
@@ -0,0 +1,48 @@
+"""
+Database engine factory.
+
+Functions:
+    create_db_engine: Build the application's async engine from settings
+"""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.config import Settings
+from app.db.codecs import json_deserializer, json_serializer
+
+
+def create_db_engine(settings: Settings) -> AsyncEngine:
+    """Create the async engine with a pooled, pre-pinged connection queue.
+
+    The pool is LIFO so a quiet app keeps reusing its most recently used
+    connection instead of cycling through ones the server may have dropped.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Async engine for ``settings.DATABASE_URL``
+    """
+    return create_async_engine(
+        settings.DATABASE_URL,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
+    )
+
+
+async def warm_up(engine: AsyncEngine) -> None:
+    """Open a pooled connection and run ``SELECT 1`` on it.
+
+    Pays the TCP, TLS and authentication cost at startup instead of on the
+    first request, and fails startup early if the database is unreachable.
+
+    Args:
+        engine: Engine to warm up
+    """
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
@@ -1,15 +1,35 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.config import settings
+from app.config import Settings, get_settings
+from app.core.logging_config import configure_logging
+from app.db.engine import create_db_engine, warm_up
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+settings = get_settings()
+
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Configure logging and open the database pool at startup.
+
+    The pool is warmed before the first request is accepted, so no user
+    request pays the connection setup cost, and is closed at shutdown.
+    """
+    app.state.settings = get_settings()
+    configure_logging(app.state.settings.LOG_LEVEL)
+    app.state.engine = create_db_engine(app.state.settings)
+    try:
+        await warm_up(app.state.engine)
+        yield
+    finally:
+        await app.state.engine.dispose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
@@ -17,6 +37,7 @@ app = FastAPI(
     debug=settings.DEBUG,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -30,7 +51,7 @@ app.add_middleware(
 
 
 @app.get("/")
-async def root():
+async def root(settings: Settings = Depends(get_settings)):
     """Health check endpoint"""
     return {
         "message": f"Welcome to {settings.APP_NAME}",
@@ -40,7 +61,7 @@ async def root():
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(settings: Settings = Depends(get_settings)):
     """Detailed health check"""
     return {
         "status": "healthy",
@@ -62,4 +83,5 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        access_log=settings.DEBUG,  # Per-request access lines only in development
     )
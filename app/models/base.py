@@ -14,28 +14,133 @@ Design Principles:
 
 Classes:
     Base: SQLAlchemy declarative base
+    I18nJSONB: Mutation-tracked JSONB type for i18n columns
     TimestampMixin: Created/updated timestamps
     SoftDeleteMixin: Soft delete functionality
     MultilingualMixin: i18n content support
     BaseModel: Abstract base combining all mixins
 """
 
-from datetime import datetime
-from typing import Any, Dict, Optional
-from uuid import uuid4
+import keyword
+import os
+import uuid
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Type, cast
 
-from sqlalchemy import Boolean, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import ColumnElement, DateTime, Index, event, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.declarative import declarative_base, declared_attr
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.orm import Mapped, Mapper, mapped_column
+from sqlalchemy.sql import func
 
 # SQLAlchemy declarative base
 Base = declarative_base()
 
+# JSONB type for i18n columns; in-place dict changes mark the row dirty and
+# None is stored as SQL NULL rather than a JSON 'null' document
+I18nJSONB = MutableDict.as_mutable(JSONB(none_as_null=True))
+
+# Sentinel for dict lookups where None/'' are legitimate values
+_MISSING = object()
+
+
+def _uuid_batcher(chunk: int = 1024) -> Callable[[], uuid.UUID]:
+    """Build a generator of random (version 4) UUIDs.
+
+    Randomness for ``chunk`` ids is read with a single ``os.urandom`` call
+    and handed out one at a time, amortizing the syscall over bulk inserts.
+    The buffer is discarded in forked children so worker processes never
+    hand out the same ids.
+
+    Args:
+        chunk: Number of UUIDs to generate per refill
+
+    Returns:
+        Zero-argument callable returning a new UUID
+    """
+    buffer: List[uuid.UUID] = []
+
+    def next_uuid() -> uuid.UUID:
+        while True:
+            try:
+                return buffer.pop()
+            except IndexError:
+                raw = os.urandom(16 * chunk)
+                buffer.extend(
+                    uuid.UUID(bytes=raw[i:i + 16], version=4)
+                    for i in range(0, len(raw), 16)
+                )
+
+    # Fork hooks are Unix-only; Windows has no fork to guard against
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=buffer.clear)
+    return next_uuid
+
+
+_next_uuid = _uuid_batcher()
+
+
+def _build_to_dict(fields: Tuple[Tuple[str, str], ...]) -> Callable[..., Dict[str, Any]]:
+    """Generate a ``to_dict`` method specialized for the given columns.
+
+    The loop over columns is unrolled into a single dict literal, so a
+    call is one attribute load per column with no iteration. Attribute
+    keys that are not plain identifiers are read with ``getattr``.
+
+    Args:
+        fields: ``(column name, attribute key)`` pairs; the column name is
+            the dict key and the attribute is where the value is read from
+
+    Returns:
+        Function usable as a ``to_dict(self, include_deleted=False)`` method
+    """
+    items = ', '.join(
+        f"{name!r}: self.{key}"
+        if key.isidentifier() and not keyword.iskeyword(key)
+        else f"{name!r}: getattr(self, {key!r})"
+        for name, key in fields
+    )
+    source = (
+        "def to_dict(self, include_deleted=False):\n"
+        "    if not include_deleted and self.is_deleted:\n"
+        "        return {}\n"
+        f"    return {{{items}}}\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, '<to_dict>', 'exec'), namespace)
+    to_dict = namespace['to_dict']
+    to_dict.__generated__ = True
+    return to_dict
+
+
+@lru_cache(maxsize=None)
+def _camel_to_snake(name: str) -> str:
+    """Convert a CamelCase identifier to snake_case (memoized per name).
+
+    A plain loop beats ``re.sub`` for identifiers this short: an
+    underscore goes before every uppercase letter except the first.
+    """
+    out = [name[0].lower()]
+    append = out.append
+    for ch in name[1:]:
+        if ch.isupper():
+            append('_')
+            append(ch.lower())
+        else:
+            append(ch)
+    return ''.join(out)
+
 
 class TimestampMixin:
     """Mixin providing automatic timestamp management.
 
+    Timestamps are generated by the database (``now()``) inside the
+    INSERT/UPDATE statement itself, so no Python-side call is made per row
+    and values are always timezone-aware.
+
     Attributes:
         created_at: UTC timestamp when record was created (immutable)
         updated_at: UTC timestamp when record was last modified (auto-updates)
@@ -50,15 +155,15 @@ class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
         doc="UTC timestamp of record creation"
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         doc="UTC timestamp of last modification"
     )
 
@@ -70,13 +175,22 @@ class SoftDeleteMixin:
     This enables data recovery and maintains referential integrity.
 
     Attributes:
-        is_deleted: Boolean flag indicating deletion status
         deleted_at: UTC timestamp when record was soft-deleted
+        is_deleted: True when ``deleted_at`` is set (derived, not stored)
 
     Methods:
         soft_delete(): Mark record as deleted
         restore(): Restore a soft-deleted record
         is_active(): Check if record is not deleted
+        active_filter(): WHERE clause selecting non-deleted rows
+        active_index(column, *columns): Partial index over non-deleted rows
+
+    Note:
+        Deletion state lives in ``deleted_at`` alone, so there is no flag
+        to keep in sync and no extra column to write. Queries should
+        filter with ``active_filter()`` (``deleted_at IS NULL``). Models
+        opt in to a matching partial index over their real filter columns
+        by adding ``active_index()`` to ``__table_args__``.
 
     Example:
         >>> user = User(email="test@example.com")
@@ -86,13 +200,8 @@ class SoftDeleteMixin:
         >>> assert user.is_active() is True
     """
 
-    is_deleted: Mapped[bool] = mapped_column(
-        Boolean,
-        nullable=False,
-        default=False,
-        index=True,
-        doc="Soft delete flag - True if record is deleted"
-    )
+    # Provided by the concrete model (BaseModel derives it from the class name)
+    __tablename__: Any
 
     deleted_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
@@ -101,22 +210,35 @@ class SoftDeleteMixin:
         doc="UTC timestamp when record was soft-deleted"
     )
 
+    @hybrid_property
+    def is_deleted(self) -> bool:
+        """Check whether the record has been soft-deleted.
+
+        Returns:
+            True if ``deleted_at`` is set
+        """
+        return self.deleted_at is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls) -> ColumnElement[bool]:
+        """SQL form of ``is_deleted``: ``deleted_at IS NOT NULL``."""
+        return cls.deleted_at.is_not(None)
+
     def soft_delete(self) -> None:
         """Mark this record as deleted.
 
-        Sets is_deleted=True and records deletion timestamp.
+        Records the deletion timestamp.
         Does not commit - caller must handle session commit.
         """
-        self.is_deleted = True
-        self.deleted_at = datetime.utcnow()
+        self.deleted_at = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         """Restore a soft-deleted record.
 
-        Clears deletion flag and timestamp.
+        Clears the deletion timestamp.
         Does not commit - caller must handle session commit.
         """
-        self.is_deleted = False
         self.deleted_at = None
 
     def is_active(self) -> bool:
@@ -127,12 +249,55 @@ class SoftDeleteMixin:
         """
         return not self.is_deleted
 
+    @classmethod
+    def active_filter(cls) -> ColumnElement[bool]:
+        """Build the WHERE clause matching non-deleted rows.
+
+        Renders exactly as the partial index predicate so PostgreSQL
+        can use the index built by ``active_index()``.
+
+        Returns:
+            SQL expression ``deleted_at IS NULL``
+
+        Example:
+            >>> select(Job).where(Job.active_filter())
+        """
+        return cls.deleted_at.is_(None)
+
+    @classmethod
+    def active_index(cls, column: str, *columns: str) -> Index:
+        """Build a partial index covering only non-deleted rows.
+
+        Not added automatically: each concrete model lists it in its
+        ``__table_args__`` with the columns its queries filter on.
+
+        Args:
+            column: First column to index
+            columns: Further columns to index
+
+        Returns:
+            Index named ``ix_<table>_active`` with ``WHERE deleted_at IS NULL``
+
+        Example:
+            >>> @declared_attr.directive
+            ... def __table_args__(cls):
+            ...     return (cls.active_index('company_id'),)
+        """
+        return Index(
+            f"ix_{cls.__tablename__}_active",
+            column,
+            *columns,
+            postgresql_where=text('deleted_at IS NULL'),
+        )
+
 
 class MultilingualMixin:
     """Mixin providing multilingual content support.
 
     Stores text content in multiple languages using PostgreSQL JSONB.
     Supports Persian (fa), Arabic (ar), Turkish (tr), and English (en).
+    Concrete i18n columns should use ``I18nJSONB`` so translations are
+    updated in place instead of reassigning the whole dict.
 
     Methods:
         get_translation(field_name, lang, fallback): Get text in specific language
@@ -149,12 +314,48 @@ class MultilingualMixin:
         'Software Engineer'  # Falls back to English if Arabic not available
     """
 
-    # Supported languages for this platform
-    SUPPORTED_LANGUAGES = ['en', 'fa', 'ar', 'tr']
+    # Supported languages for this platform (frozenset for O(1) membership,
+    # tuple when a stable display order is needed)
+    SUPPORTED_LANGUAGES_ORDERED: ClassVar[Tuple[str, ...]] = ('en', 'fa', 'ar', 'tr')
+    SUPPORTED_LANGUAGES: ClassVar[FrozenSet[str]] = frozenset(SUPPORTED_LANGUAGES_ORDERED)
     DEFAULT_LANGUAGE = 'en'
 
     # RTL (Right-to-Left) languages
-    RTL_LANGUAGES = ['fa', 'ar']
+    RTL_LANGUAGES: ClassVar[FrozenSet[str]] = frozenset(('fa', 'ar'))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _i18n_fields(cls) -> FrozenSet[str]:
+        """Get the names of this model's JSONB (i18n) columns, cached per class.
+
+        Returns:
+            Frozenset of mapped attribute names whose column type is JSONB
+
+        Raises:
+            ValueError: If the class is not a mapped model
+        """
+        mapper = getattr(cls, '__mapper__', None)
+        if mapper is None:
+            raise ValueError(f"{cls.__name__} is not a mapped model and has no i18n fields")
+
+        return frozenset(
+            key for key, column in mapper.columns.items()
+            if isinstance(column.type, JSONB)
+        )
+
+    def _invalid_field_error(self, field_name: str) -> ValueError:
+        """Build the error for a field that can't hold translations.
+
+        Args:
+            field_name: Name rejected by the i18n field check
+
+        Returns:
+            ValueError saying whether the field is missing or just not JSONB
+        """
+        model = self.__class__.__name__
+        if hasattr(self, field_name):
+            return ValueError(f"Field '{field_name}' on {model} is not an i18n (JSONB) field")
+        return ValueError(f"Field '{field_name}' does not exist on {model}")
 
     def get_translation(
         self,
@@ -179,24 +380,26 @@ class MultilingualMixin:
             >>> job.get_translation('title_i18n', 'fa', fallback='en')
             'مهندس نرم‌افزار'
         """
-        if not hasattr(self, field_name):
-            raise ValueError(f"Field '{field_name}' does not exist on {self.__class__.__name__}")
+        if field_name not in self._i18n_fields():
+            raise self._invalid_field_error(field_name)
 
         content: Optional[Dict[str, str]] = getattr(self, field_name)
 
         if not content:
             return None
 
-        # Try requested language first
-        if lang in content:
-            return content[lang]
+        # Try requested language first (sentinel keeps '' a valid translation)
+        value = content.get(lang, _MISSING)
+        if value is not _MISSING:
+            return cast(str, value)
 
         # Fall back to fallback language
-        if fallback in content:
-            return content[fallback]
+        value = content.get(fallback, _MISSING)
+        if value is not _MISSING:
+            return cast(str, value)
 
         # Return any available language as last resort
-        return next(iter(content.values())) if content else None
+        return next(iter(content.values()), None)
 
     def set_translation(
         self,
@@ -217,12 +420,12 @@ class MultilingualMixin:
         Example:
             >>> job.set_translation('title_i18n', 'fa', 'مهندس نرم‌افزار')
         """
-        if not hasattr(self, field_name):
-            raise ValueError(f"Field '{field_name}' does not exist on {self.__class__.__name__}")
+        if field_name not in self._i18n_fields():
+            raise self._invalid_field_error(field_name)
 
         if lang not in self.SUPPORTED_LANGUAGES:
             raise ValueError(
-                f"Language '{lang}' not supported. Use: {', '.join(self.SUPPORTED_LANGUAGES)}"
+                f"Language '{lang}' not supported. Use: {', '.join(self.SUPPORTED_LANGUAGES_ORDERED)}"
             )
 
         if not isinstance(value, str):
@@ -230,11 +433,13 @@ class MultilingualMixin:
 
         current_content: Optional[Dict[str, str]] = getattr(self, field_name)
 
-        if current_content is None:
-            current_content = {}
-
-        current_content[lang] = value
-        setattr(self, field_name, current_content)
+        if isinstance(current_content, MutableDict):
+            # Mutation-tracked column: the change event fires on its own
+            current_content[lang] = value
+        else:
+            # Plain JSONB isn't mutation-tracked, so assign a new dict
+            # (an in-place edit of the loaded dict would never be flushed)
+            setattr(self, field_name, {**(current_content or {}), lang: value})
 
     def get_supported_languages(self, field_name: str) -> list[str]:
         """Get list of languages available for a specific field.
@@ -249,8 +454,8 @@ class MultilingualMixin:
             >>> job.get_supported_languages('title_i18n')
             ['en', 'fa', 'ar']
         """
-        if not hasattr(self, field_name):
-            raise ValueError(f"Field '{field_name}' does not exist")
+        if field_name not in self._i18n_fields():
+            raise self._invalid_field_error(field_name)
 
         content: Optional[Dict[str, str]] = getattr(self, field_name)
         return list(content.keys()) if content else []
@@ -283,8 +488,8 @@ class BaseModel(Base, TimestampMixin, SoftDeleteMixin, MultilingualMixin):
         id: UUID primary key
         created_at: Creation timestamp (from TimestampMixin)
         updated_at: Last update timestamp (from TimestampMixin)
-        is_deleted: Soft delete flag (from SoftDeleteMixin)
         deleted_at: Deletion timestamp (from SoftDeleteMixin)
+        is_deleted: Derived soft delete flag (from SoftDeleteMixin)
 
     Note:
         This is an abstract class - it won't create a table.
@@ -298,14 +503,18 @@ class BaseModel(Base, TimestampMixin, SoftDeleteMixin, MultilingualMixin):
 
     __abstract__ = True  # Don't create table for base class
 
-    id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    # Fetch server-generated timestamps via RETURNING on flush, so async
+    # sessions never need a lazy refresh to read created_at/updated_at
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=_next_uuid,
         doc="UUID primary key - globally unique identifier"
     )
 
-    @declared_attr
+    @declared_attr.directive
     def __tablename__(cls) -> str:
         """Generate table name from class name.
 
@@ -319,10 +528,7 @@ class BaseModel(Base, TimestampMixin, SoftDeleteMixin, MultilingualMixin):
             UserProfile -> user_profile
             JobApplication -> job_application
         """
-        import re
-        name = cls.__name__
-        # Convert CamelCase to snake_case
-        return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+        return _camel_to_snake(cls.__name__)
 
     def __repr__(self) -> str:
         """String representation for debugging.
@@ -332,6 +538,41 @@ class BaseModel(Base, TimestampMixin, SoftDeleteMixin, MultilingualMixin):
         """
         return f"<{self.__class__.__name__}(id={self.id})>"
 
+    @classmethod
+    def _column_fields(cls) -> Tuple[Tuple[str, str], ...]:
+        """Get ``(column name, attribute key)`` pairs, cached on the class.
+
+        Built from the mapper's column attributes, so an attribute mapped
+        to a differently named column (``kind = mapped_column('type')``)
+        is read through its attribute. Looked up in ``cls.__dict__`` so
+        that subclasses never reuse a parent's cache.
+
+        Returns:
+            Tuple of ``(column name, attribute key)`` pairs
+        """
+        fields = cls.__dict__.get('__column_fields__')
+        if fields is None:
+            fields = tuple(
+                (getattr(prop.columns[0], 'name', prop.key), prop.key)
+                for prop in cls.__mapper__.column_attrs
+            )
+            cls.__column_fields__ = fields
+        return fields
+
+    @classmethod
+    def _generated_to_dict(cls) -> Callable[..., Dict[str, Any]]:
+        """Get this class's generated ``to_dict`` function, cached on the class.
+
+        Returns:
+            Function built by ``_build_to_dict`` from ``_column_fields()``
+        """
+        to_dict = cls.__dict__.get('__generated_to_dict__')
+        if to_dict is None:
+            to_dict = _build_to_dict(cls._column_fields())
+            to_dict.__doc__ = BaseModel.to_dict.__doc__
+            cls.__generated_to_dict__ = to_dict
+        return to_dict
+
     def to_dict(self, include_deleted: bool = False) -> Dict[str, Any]:
         """Convert model to dictionary representation.
 
@@ -343,11 +584,23 @@ class BaseModel(Base, TimestampMixin, SoftDeleteMixin, MultilingualMixin):
 
         Note:
             Useful for API serialization. Consider using Pydantic schemas instead.
+            Each mapped subclass gets the generated version installed directly
+            once its mapper is configured (see ``_install_to_dict``); this
+            method serves ``super().to_dict()`` calls from custom overrides.
         """
-        if not include_deleted and self.is_deleted:
-            return {}
+        return type(self)._generated_to_dict()(self, include_deleted)
+
+
+@event.listens_for(BaseModel, "mapper_configured", propagate=True)
+def _install_to_dict(mapper: Mapper[Any], cls: Type[BaseModel]) -> None:
+    """Give each concrete model its own generated ``to_dict``.
+
+    Models that define ``to_dict`` themselves (or inherit one from a
+    model that does) keep it; only the generic and generated versions
+    are replaced.
+    """
+    current = cls.to_dict
+    if current is not BaseModel.to_dict and not getattr(current, '__generated__', False):
+        return
 
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+    setattr(cls, 'to_dict', cls._generated_to_dict())
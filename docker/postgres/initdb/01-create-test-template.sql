@@ -0,0 +1,9 @@
+-- Template database for the test suite.
+--
+-- The pytest `engine` fixture builds the schema in this database
+-- (Base.metadata.create_all), records a hash of it as the database
+-- comment, and clones it per test session with CREATE DATABASE ...
+-- TEMPLATE forsa_test_template, which copies files instead of replaying
+-- DDL. The template is rebuilt whenever the hash no longer matches the
+-- models. Runs only when the postgres volume is empty.
+CREATE DATABASE forsa_test_template;
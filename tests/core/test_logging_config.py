@@ -0,0 +1,41 @@
+"""Unit tests for process logging setup."""
+
+import logging
+
+import pytest
+
+from app.core.logging_config import configure_logging
+
+
+@pytest.fixture
+def root_logger():
+    """Provide the root logger with its handlers and level restored after the test."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+@pytest.mark.unit
+class TestConfigureLogging:
+    """Test configure_logging handler and level handling."""
+
+    def test_installs_handler_when_root_has_none(self, root_logger):
+        """Test that a console handler is added to an unconfigured root logger."""
+        root_logger.handlers[:] = []
+
+        configure_logging("debug")
+
+        assert len(root_logger.handlers) == 1
+        assert root_logger.level == logging.DEBUG
+
+    def test_keeps_existing_handlers(self, root_logger):
+        """Test that repeated calls only change the level, never add handlers."""
+        root_logger.handlers[:] = [logging.NullHandler()]
+
+        configure_logging("INFO")
+        configure_logging("WARNING")
+
+        assert len(root_logger.handlers) == 1
+        assert root_logger.level == logging.WARNING
@@ -0,0 +1,101 @@
+"""Tests for the orjson-backed JSON codec."""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, insert, select, text
+
+from app.db.codecs import json_deserializer, json_serializer
+from app.models.base import I18nJSONB
+
+# Standalone metadata so the probe table never reaches the template schema
+probe_metadata = MetaData()
+codec_probe = Table(
+    "codec_probe",
+    probe_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("content", I18nJSONB),
+)
+
+
+@pytest.mark.unit
+@pytest.mark.multilingual
+class TestJsonCodec:
+    """Test JSON serialization used for JSONB columns."""
+
+    def test_serializer_returns_str(self):
+        """Test that the serializer returns text, as the asyncpg dialect expects."""
+        assert json_serializer({"en": "Engineer"}) == '{"en":"Engineer"}'
+
+    def test_serializer_keeps_non_ascii_text(self):
+        """Test that Persian text is written directly, not as escapes."""
+        assert json_serializer({"fa": "مهندس"}) == '{"fa":"مهندس"}'
+
+    def test_round_trip(self):
+        """Test that i18n content survives a serialize/deserialize cycle."""
+        content = {
+            "en": "Software Engineer",
+            "fa": "مهندس نرم‌افزار",
+            "ar": "مهندس برمجيات",
+        }
+
+        assert json_deserializer(json_serializer(content)) == content
+
+    def test_none_round_trips_as_json_null(self):
+        """Test that None encodes to JSON null."""
+        assert json_serializer(None) == "null"
+        assert json_deserializer("null") is None
+
+    def test_serializer_coerces_non_str_keys(self):
+        """Test that integer keys are written as strings, matching json.dumps."""
+        assert json_serializer({1: "one"}) == '{"1":"one"}'
+
+    def test_serializer_encodes_datetime_and_uuid_as_strings(self):
+        """Test that datetime and UUID values are encoded, and read back as strings."""
+        value = {
+            "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "id": UUID("12345678-1234-5678-1234-567812345678"),
+        }
+
+        assert json_deserializer(json_serializer(value)) == {
+            "at": "2024-01-02T03:04:05+00:00",
+            "id": "12345678-1234-5678-1234-567812345678",
+        }
+
+
+@pytest.mark.integration
+@pytest.mark.multilingual
+class TestJsonCodecRoundTrip:
+    """Test that JSONB columns go through the engine's codec."""
+
+    @pytest.fixture
+    async def probe_session(self, session):
+        """Create the probe table inside the test transaction."""
+        connection = await session.connection()
+        await connection.run_sync(probe_metadata.create_all)
+        return session
+
+    async def test_engine_uses_codec(self, engine):
+        """Test that the engine is configured with the orjson codec."""
+        assert engine.dialect._json_serializer is json_serializer
+        assert engine.dialect._json_deserializer is json_deserializer
+
+    async def test_persian_text_round_trips(self, probe_session):
+        """Test that Persian i18n content is stored and read back unchanged."""
+        content = {"en": "Software Engineer", "fa": "مهندس نرم‌افزار"}
+        await probe_session.execute(insert(codec_probe).values(id=1, content=content))
+
+        stored = await probe_session.scalar(select(codec_probe.c.content).where(codec_probe.c.id == 1))
+        fa = await probe_session.scalar(text("SELECT content ->> 'fa' FROM codec_probe WHERE id = 1"))
+
+        assert stored == content
+        assert fa == "مهندس نرم‌افزار"
+
+    async def test_none_is_stored_as_sql_null(self, probe_session):
+        """Test that None is written as SQL NULL rather than JSON null."""
+        await probe_session.execute(insert(codec_probe).values(id=1, content=None))
+
+        is_null = await probe_session.scalar(text("SELECT content IS NULL FROM codec_probe WHERE id = 1"))
+
+        assert is_null is True
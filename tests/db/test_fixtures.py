@@ -0,0 +1,44 @@
+"""Integration tests for the database test fixtures.
+
+These pin down guarantees other database tests rely on: data a test
+commits never reaches the database, and the connection pool is open
+before the first test runs.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from tests.conftest import TEST_POOL_SIZE
+
+# Table created inside the test session; only the outer rollback removes it
+PROBE_TABLE = "savepoint_probe"
+
+
+@pytest.mark.integration
+class TestSessionIsolation:
+    """Test that the session fixture keeps committed work out of the database."""
+
+    async def test_commit_only_releases_savepoint(self, engine, session):
+        """Test that a commit is visible in the session but not to other connections."""
+        await session.execute(text(f"CREATE TABLE {PROBE_TABLE} (id integer)"))
+        await session.execute(text(f"INSERT INTO {PROBE_TABLE} (id) VALUES (1)"))
+        await session.commit()
+
+        count = await session.scalar(text(f"SELECT count(*) FROM {PROBE_TABLE}"))
+        async with engine.connect() as other:
+            table = await other.scalar(text(f"SELECT to_regclass('{PROBE_TABLE}')"))
+
+        assert count == 1
+        assert table is None
+
+
+@pytest.mark.integration
+class TestEnginePool:
+    """Test the session-wide engine's connection pool."""
+
+    async def test_pool_is_warmed(self, engine):
+        """Test that every pooled connection is opened and idle before tests use it."""
+        pool = engine.sync_engine.pool
+
+        assert pool.size() == TEST_POOL_SIZE
+        assert pool.checkedin() == TEST_POOL_SIZE
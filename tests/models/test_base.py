@@ -4,15 +4,26 @@ Tests focus on mixin behavior and logic without requiring database.
 Integration tests will be added separately once basic infrastructure is stable.
 """
 
+import os
 from datetime import datetime
+from types import SimpleNamespace
 from uuid import UUID
 
 import pytest
 from freezegun import freeze_time
+from sqlalchemy import DateTime, String, column
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.orm import Mapped, configure_mappers, declared_attr, mapped_column
 
 from app.models.base import (
+    Base,
+    BaseModel,
     MultilingualMixin,
     SoftDeleteMixin,
+    _build_to_dict,
+    _camel_to_snake,
+    _uuid_batcher,
 )
 
 
@@ -24,10 +35,10 @@ class MockSoftDeleteModel:
     """Mock model for testing SoftDeleteMixin without database."""
 
     def __init__(self):
-        self.is_deleted = False
         self.deleted_at = None
 
     # Add mixin methods
+    is_deleted = SoftDeleteMixin.__dict__['is_deleted']
     soft_delete = SoftDeleteMixin.soft_delete
     restore = SoftDeleteMixin.restore
     is_active = SoftDeleteMixin.is_active
@@ -45,19 +56,28 @@ class TestSoftDeleteMixin:
         assert model.is_deleted is False
         assert model.deleted_at is None
 
-    def test_soft_delete_sets_flags(self):
-        """Test that soft_delete() sets deletion flags."""
+    def test_soft_delete_sets_timestamp(self):
+        """Test that soft_delete() records the deletion timestamp."""
         model = MockSoftDeleteModel()
 
         with freeze_time("2025-01-01 12:00:00"):
             model.soft_delete()
 
-        assert model.is_deleted is True
         assert model.deleted_at is not None
         assert isinstance(model.deleted_at, datetime)
+        assert model.is_deleted is True
 
-    def test_restore_clears_flags(self):
-        """Test that restore() clears deletion flags."""
+    def test_soft_delete_timestamp_is_timezone_aware(self):
+        """Test that soft_delete() records an aware UTC timestamp."""
+        model = MockSoftDeleteModel()
+
+        model.soft_delete()
+
+        assert model.deleted_at.tzinfo is not None
+        assert model.deleted_at.utcoffset().total_seconds() == 0
+
+    def test_restore_clears_timestamp(self):
+        """Test that restore() clears the deletion timestamp."""
         model = MockSoftDeleteModel()
         model.soft_delete()
 
@@ -96,6 +116,65 @@ class TestSoftDeleteMixin:
         assert model.is_deleted is True
 
 
+class MockSoftDeleteTable:
+    """Mock mapped class exposing a deleted_at column expression."""
+
+    __tablename__ = 'job'
+    deleted_at = column('deleted_at', DateTime)
+
+    is_deleted = SoftDeleteMixin.__dict__['is_deleted']
+    active_filter = SoftDeleteMixin.__dict__['active_filter']
+    active_index = SoftDeleteMixin.__dict__['active_index']
+
+
+@pytest.mark.unit
+@pytest.mark.models
+class TestSoftDeleteQueryHelpers:
+    """Test partial index and filter helpers of SoftDeleteMixin."""
+
+    def test_active_filter_matches_partial_index_predicate(self):
+        """Test that active_filter renders as the partial index predicate."""
+        clause = MockSoftDeleteTable.active_filter()
+
+        assert str(clause.compile(dialect=postgresql.dialect())) == 'deleted_at IS NULL'
+
+    def test_is_deleted_expression_checks_deleted_at(self):
+        """Test that is_deleted renders as a deleted_at NULL check in SQL."""
+        clause = MockSoftDeleteTable.is_deleted
+
+        assert str(clause.compile(dialect=postgresql.dialect())) == 'deleted_at IS NOT NULL'
+
+    def test_active_index_is_partial(self):
+        """Test that active_index builds a partial index on the given column."""
+        index = MockSoftDeleteTable.active_index('company_id')
+
+        assert index.name == 'ix_job_active'
+        assert [str(expr) for expr in index.expressions] == ['company_id']
+        assert str(index.dialect_options['postgresql']['where']) == 'deleted_at IS NULL'
+
+    def test_active_index_accepts_columns(self):
+        """Test that active_index indexes the given columns."""
+        index = MockSoftDeleteTable.active_index('company_id', 'created_at')
+
+        assert [str(expr) for expr in index.expressions] == ['company_id', 'created_at']
+
+    def test_models_have_no_active_index_unless_declared(self, declared_tables):
+        """Test that BaseModel adds no partial index; models opt in via __table_args__."""
+
+        class IndexDefaultModel(BaseModel):
+            title: Mapped[str] = mapped_column(String)
+
+        class IndexOptInModel(BaseModel):
+            title: Mapped[str] = mapped_column(String)
+
+            @declared_attr.directive
+            def __table_args__(cls):
+                return (cls.active_index('title'),)
+
+        assert IndexDefaultModel.__table__.indexes == set()
+        assert [index.name for index in IndexOptInModel.__table__.indexes] == ['ix_index_opt_in_model_active']
+
+
 # ============================================================================
 # MultilingualMixin Tests (Pure Unit Tests - No Database)
 # ============================================================================
@@ -104,14 +183,22 @@ class MockMultilingualModel:
     """Mock model for testing MultilingualMixin without database."""
 
     def __init__(self):
+        self.name = 'Acme'
         self.title_i18n = None
         self.description_i18n = None
 
     # Add mixin methods and constants
     SUPPORTED_LANGUAGES = MultilingualMixin.SUPPORTED_LANGUAGES
+    SUPPORTED_LANGUAGES_ORDERED = MultilingualMixin.SUPPORTED_LANGUAGES_ORDERED
     DEFAULT_LANGUAGE = MultilingualMixin.DEFAULT_LANGUAGE
     RTL_LANGUAGES = MultilingualMixin.RTL_LANGUAGES
 
+    @classmethod
+    def _i18n_fields(cls):
+        # No mapper on the mock, so declare the JSONB fields explicitly
+        return frozenset(('title_i18n', 'description_i18n'))
+
+    _invalid_field_error = MultilingualMixin._invalid_field_error
     get_translation = MultilingualMixin.get_translation
     set_translation = MultilingualMixin.set_translation
     get_supported_languages = MultilingualMixin.get_supported_languages
@@ -126,7 +213,8 @@ class TestMultilingualMixin:
 
     def test_supported_languages_constant(self):
         """Test that SUPPORTED_LANGUAGES contains expected languages."""
-        assert MultilingualMixin.SUPPORTED_LANGUAGES == ['en', 'fa', 'ar', 'tr']
+        assert set(MultilingualMixin.SUPPORTED_LANGUAGES) == {'en', 'fa', 'ar', 'tr'}
+        assert MultilingualMixin.SUPPORTED_LANGUAGES_ORDERED == ('en', 'fa', 'ar', 'tr')
 
     def test_default_language_is_english(self):
         """Test that DEFAULT_LANGUAGE is English."""
@@ -134,7 +222,7 @@ class TestMultilingualMixin:
 
     def test_rtl_languages_constant(self):
         """Test that RTL_LANGUAGES contains Persian and Arabic."""
-        assert MultilingualMixin.RTL_LANGUAGES == ['fa', 'ar']
+        assert set(MultilingualMixin.RTL_LANGUAGES) == {'fa', 'ar'}
 
     def test_set_translation_creates_content(self):
         """Test setting translation for a field."""
@@ -158,6 +246,17 @@ class TestMultilingualMixin:
             'ar': 'مهندس برمجيات'
         }
 
+    def test_set_translation_mutates_tracked_dict_in_place(self):
+        """Test that mutation-tracked content is updated without reassignment."""
+        model = MockMultilingualModel()
+        model.title_i18n = MutableDict({'en': 'Software Engineer'})
+        tracked = model.title_i18n
+
+        model.set_translation('title_i18n', 'fa', 'مهندس نرم‌افزار')
+
+        assert model.title_i18n is tracked
+        assert tracked == {'en': 'Software Engineer', 'fa': 'مهندس نرم‌افزار'}
+
     def test_get_translation_returns_correct_language(self):
         """Test retrieving translation in specific language."""
         model = MockMultilingualModel()
@@ -178,6 +277,25 @@ class TestMultilingualMixin:
 
         assert result == 'Software Engineer'
 
+    def test_get_translation_falls_back_to_any_language(self):
+        """Test that any available translation is used as a last resort."""
+        model = MockMultilingualModel()
+        model.set_translation('title_i18n', 'ar', 'مهندس برمجيات')
+
+        result = model.get_translation('title_i18n', 'tr', fallback='en')
+
+        assert result == 'مهندس برمجيات'
+
+    def test_get_translation_keeps_empty_string(self):
+        """Test that an empty translation is returned rather than skipped."""
+        model = MockMultilingualModel()
+        model.set_translation('title_i18n', 'en', 'Software Engineer')
+        model.set_translation('title_i18n', 'fa', '')
+
+        result = model.get_translation('title_i18n', 'fa')
+
+        assert result == ''
+
     def test_get_translation_returns_none_if_not_found(self):
         """Test that get_translation returns None if no translation exists."""
         model = MockMultilingualModel()
@@ -193,11 +311,30 @@ class TestMultilingualMixin:
         with pytest.raises(ValueError, match="does not exist"):
             model.set_translation('invalid_field', 'en', 'Test')
 
+    def test_get_translation_raises_error_for_invalid_field(self):
+        """Test that get_translation raises error for non-existent field."""
+        model = MockMultilingualModel()
+
+        with pytest.raises(ValueError, match="does not exist"):
+            model.get_translation('invalid_field', 'en')
+
+    def test_get_translation_rejects_non_i18n_field(self):
+        """Test that an existing non-JSONB field is reported as not an i18n field."""
+        model = MockMultilingualModel()
+
+        with pytest.raises(ValueError, match=r"'name' on MockMultilingualModel is not an i18n \(JSONB\) field"):
+            model.get_translation('name', 'en')
+
+    def test_i18n_fields_requires_mapped_class(self):
+        """Test that an unmapped class raises ValueError instead of AttributeError."""
+        with pytest.raises(ValueError, match="not a mapped model"):
+            MultilingualMixin._i18n_fields()
+
     def test_set_translation_raises_error_for_unsupported_language(self):
         """Test that set_translation raises error for unsupported language."""
         model = MockMultilingualModel()
 
-        with pytest.raises(ValueError, match="not supported"):
+        with pytest.raises(ValueError, match="not supported. Use: en, fa, ar, tr"):
             model.set_translation('title_i18n', 'de', 'Test')
 
     def test_set_translation_raises_error_for_non_string_value(self):
@@ -240,3 +377,222 @@ class TestMultilingualMixin:
     def test_is_rtl_language_false_for_turkish(self):
         """Test that Turkish is not RTL language."""
         assert MultilingualMixin.is_rtl_language('tr') is False
+
+
+# ============================================================================
+# BaseModel Tests (Pure Unit Tests - No Database)
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.models
+class TestTableName:
+    """Test CamelCase to snake_case table name generation."""
+
+    @pytest.mark.parametrize(
+        "class_name, expected",
+        [
+            ("User", "user"),
+            ("UserProfile", "user_profile"),
+            ("JobApplication", "job_application"),
+            ("AIModel", "a_i_model"),
+            ("Job2Application", "job2_application"),
+        ],
+    )
+    def test_camel_to_snake(self, class_name, expected):
+        """Test conversion of class names to table names."""
+        assert _camel_to_snake(class_name) == expected
+
+    def test_tablename_derived_from_class_name(self):
+        """Test that __tablename__ is generated from the class name."""
+        assert BaseModel.__tablename__ == 'base_model'
+
+
+def mock_mapper(*names):
+    """Build a stand-in mapper whose column attributes match their column names."""
+    return SimpleNamespace(
+        column_attrs=[SimpleNamespace(key=name, columns=[SimpleNamespace(name=name)]) for name in names]
+    )
+
+
+class MockSerializableModel:
+    """Mock model for testing BaseModel.to_dict without database."""
+
+    __mapper__ = mock_mapper('id', 'title', 'deleted_at')
+
+    def __init__(self):
+        self.id = 'abc'
+        self.title = 'Engineer'
+        self.deleted_at = None
+
+    is_deleted = SoftDeleteMixin.__dict__['is_deleted']
+    _column_fields = BaseModel.__dict__['_column_fields']
+    _generated_to_dict = BaseModel.__dict__['_generated_to_dict']
+    to_dict = BaseModel.to_dict
+
+
+class MockSerializableChild(MockSerializableModel):
+    """Subclass with an extra column to check per-class caching."""
+
+    __mapper__ = mock_mapper('id', 'title', 'deleted_at', 'salary')
+
+    def __init__(self):
+        super().__init__()
+        self.salary = 100
+
+
+@pytest.mark.unit
+@pytest.mark.models
+class TestToDict:
+    """Test BaseModel.to_dict serialization."""
+
+    def test_to_dict_returns_all_columns(self):
+        """Test that to_dict maps every column name to its value."""
+        model = MockSerializableModel()
+
+        assert model.to_dict() == {'id': 'abc', 'title': 'Engineer', 'deleted_at': None}
+
+    def test_to_dict_empty_for_deleted_record(self):
+        """Test that deleted records serialize to an empty dict by default."""
+        model = MockSerializableModel()
+        model.deleted_at = datetime(2025, 1, 1)
+
+        assert model.to_dict() == {}
+        assert model.to_dict(include_deleted=True)['deleted_at'] is not None
+
+    def test_column_fields_cached_per_class(self):
+        """Test that subclasses build their own column cache."""
+        parent = MockSerializableModel()
+        child = MockSerializableChild()
+
+        assert parent.to_dict() == {'id': 'abc', 'title': 'Engineer', 'deleted_at': None}
+        assert child.to_dict()['salary'] == 100
+        assert MockSerializableModel.__dict__['__column_fields__'] == (
+            ('id', 'id'),
+            ('title', 'title'),
+            ('deleted_at', 'deleted_at'),
+        )
+
+    def test_generated_to_dict_matches_generic(self):
+        """Test that the generated to_dict returns the same dict as the generic one."""
+        model = MockSerializableChild()
+        to_dict = _build_to_dict(
+            tuple((name, name) for name in ('id', 'title', 'deleted_at', 'salary'))
+        )
+
+        assert to_dict(model) == BaseModel.to_dict(model)
+
+    def test_generated_to_dict_empty_for_deleted_record(self):
+        """Test that the generated to_dict keeps the include_deleted check."""
+        model = MockSerializableModel()
+        model.deleted_at = datetime(2025, 1, 1)
+        to_dict = _build_to_dict((('id', 'id'), ('deleted_at', 'deleted_at')))
+
+        assert to_dict(model) == {}
+        assert to_dict(model, include_deleted=True) == {'id': 'abc', 'deleted_at': datetime(2025, 1, 1)}
+
+    def test_generated_to_dict_reads_keyword_attribute_keys(self):
+        """Test that attribute keys that aren't valid identifiers still serialize."""
+        model = MockSerializableModel()
+        setattr(model, 'class', 'A')
+        to_dict = _build_to_dict((('id', 'id'), ('class', 'class')))
+
+        assert to_dict(model) == {'id': 'abc', 'class': 'A'}
+
+    def test_generated_to_dict_reads_attribute_key_for_renamed_column(self):
+        """Test that values come from the attribute and keys from the column name."""
+        model = MockSerializableModel()
+        model.kind = 'remote'
+        to_dict = _build_to_dict((('id', 'id'), ('type', 'kind')))
+
+        assert to_dict(model) == {'id': 'abc', 'type': 'remote'}
+
+
+@pytest.fixture
+def declared_tables():
+    """Remove tables declared inside a test from the shared metadata afterwards."""
+    before = set(Base.metadata.tables)
+    yield
+    for name in set(Base.metadata.tables) - before:
+        Base.metadata.remove(Base.metadata.tables[name])
+
+
+@pytest.mark.unit
+@pytest.mark.models
+class TestInstallToDict:
+    """Test the mapper_configured hook on real declarative models."""
+
+    def test_installs_generated_to_dict_from_mapper(self, declared_tables):
+        """Test that a configured model gets a to_dict built from its column attributes."""
+
+        class ToDictWidget(BaseModel):
+            kind: Mapped[str] = mapped_column('type', String)
+            title: Mapped[str] = mapped_column(String)
+
+        configure_mappers()
+        widget = ToDictWidget(kind='remote', title='Engineer')
+
+        result = widget.to_dict()
+
+        assert ToDictWidget.__dict__['to_dict'].__generated__ is True
+        assert result['type'] == 'remote'
+        assert result['title'] == 'Engineer'
+        assert set(result) == {'id', 'created_at', 'updated_at', 'deleted_at', 'type', 'title'}
+
+    def test_keeps_to_dict_defined_on_model(self, declared_tables):
+        """Test that a model's own to_dict is not replaced."""
+
+        class ToDictCustom(BaseModel):
+            title: Mapped[str] = mapped_column(String)
+
+            def to_dict(self, include_deleted=False):
+                return {'custom': True}
+
+        configure_mappers()
+
+        assert ToDictCustom(title='Engineer').to_dict() == {'custom': True}
+
+    def test_super_to_dict_reads_renamed_column_attribute(self, declared_tables):
+        """Test that a custom to_dict can extend super().to_dict() with renamed columns."""
+
+        class ToDictExtended(BaseModel):
+            kind: Mapped[str] = mapped_column('type', String)
+
+            def to_dict(self, include_deleted=False):
+                return {**super().to_dict(include_deleted), 'extra': 1}
+
+        configure_mappers()
+
+        result = ToDictExtended(kind='remote').to_dict()
+
+        assert result['type'] == 'remote'
+        assert result['extra'] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.models
+class TestUuidBatcher:
+    """Test batched UUID primary key generation."""
+
+    def test_generates_native_uuid4_values(self):
+        """Test that generated ids are native version 4 UUIDs."""
+        next_uuid = _uuid_batcher(chunk=4)
+
+        value = next_uuid()
+
+        assert isinstance(value, UUID)
+        assert value.version == 4
+
+    def test_generates_unique_ids_across_refills(self):
+        """Test that ids stay unique when the buffer is refilled."""
+        next_uuid = _uuid_batcher(chunk=8)
+
+        values = {next_uuid() for _ in range(100)}
+
+        assert len(values) == 100
+
+    def test_works_without_fork_hooks(self, monkeypatch):
+        """Test that platforms without os.register_at_fork (Windows) are supported."""
+        monkeypatch.delattr(os, 'register_at_fork', raising=False)
+        next_uuid = _uuid_batcher(chunk=4)
+
+        assert next_uuid().version == 4
@@ -0,0 +1,35 @@
+"""Smoke tests for the FastAPI application entry points."""
+
+import pytest
+
+
+@pytest.mark.smoke
+@pytest.mark.api
+class TestHealthEndpoints:
+    """Test root and health check endpoints."""
+
+    def test_root_returns_app_info(self, client, settings):
+        """Test that the root endpoint reports the app name and version."""
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.json()["message"] == f"Welcome to {settings.APP_NAME}"
+        assert response.json()["version"] == settings.APP_VERSION
+
+    def test_health_uses_test_settings(self, client):
+        """Test that the app is served with the env-only test settings."""
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["environment"] == "test"
+
+
+@pytest.mark.smoke
+@pytest.mark.integration
+class TestLifespan:
+    """Test startup and shutdown hooks."""
+
+    def test_lifespan_opens_database_engine(self, client, settings):
+        """Test that startup stores the engine and settings on app state."""
+        assert client.app.state.settings is settings
+        assert client.app.state.engine.url.database == settings.DATABASE_URL.rsplit("/", 1)[-1]